@@ -4,12 +4,21 @@ Custom integration to integrate Aldes with Home Assistant.
 For more details about this integration, please refer to
 https://github.com/guix77/homeassistant-aldes
 """
+from datetime import timedelta
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import aiohttp_client
 
 from .api import AldesApi
-from .const import CONF_PASSWORD, CONF_USERNAME, DOMAIN, PLATFORMS
+from .const import (
+    CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
+    CONF_USERNAME,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    PLATFORMS,
+)
 from .coordinator import AldesDataUpdateCoordinator
 
 
@@ -20,9 +29,23 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         entry.data[CONF_PASSWORD],
         aiohttp_client.async_get_clientsession(hass),
     )
-    coordinator = AldesDataUpdateCoordinator(hass, api)
+    coordinator = AldesDataUpdateCoordinator(hass, api, _get_update_interval(entry))
     await coordinator.async_config_entry_first_refresh()
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     await coordinator.async_request_refresh()
     return True
+
+
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply a new polling interval without reloading the entry."""
+    coordinator: AldesDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.set_update_interval(_get_update_interval(entry))
+
+
+def _get_update_interval(entry: ConfigEntry) -> timedelta:
+    """Return the polling interval set in the entry options."""
+    return timedelta(
+        seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    )
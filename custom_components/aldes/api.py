@@ -1,8 +1,38 @@
 """Sample API Client."""
-from typing import Dict
+from typing import Dict, TypedDict
 import aiohttp
 
 
+class Thermostat(TypedDict):
+    """Thermostat as returned by the products endpoint."""
+
+    ThermostatId: int
+    Name: str
+    TemperatureSet: float
+    CurrentTemperature: float
+
+
+class Indicator(TypedDict):
+    """Product indicators as returned by the products endpoint."""
+
+    current_air_mode: str
+    cmist: float
+    cmast: float
+    fmist: float
+    fmast: float
+    thermostats: list[Thermostat]
+
+
+class Product(TypedDict):
+    """Product as returned by the products endpoint."""
+
+    serial_number: str
+    reference: str
+    modem: str
+    isConnected: bool
+    indicator: Indicator
+
+
 class AldesApi:
     """Aldes API client."""
 
@@ -53,11 +83,12 @@ class AldesApi:
         ) as response:
             return await response.json()
 
-    async def fetch_data(self):
+    async def fetch_data(self) -> list[Product]:
         """Fetch data."""
         async with await self._request_with_auth_interceptor(
             self._session.get, self._API_URL_PRODUCTS
         ) as response:
+            response.raise_for_status()
             return await response.json()
 
     async def set_target_temperature(
@@ -1,34 +1,34 @@
 """Support for the Aldes binary sensors."""
 from __future__ import annotations
+from typing import TYPE_CHECKING
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.components.binary_sensor import BinarySensorEntity
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
-from .const import DOMAIN, MANUFACTURER, FRIENDLY_NAMES
+from .const import DOMAIN, FRIENDLY_NAMES, MANUFACTURER
+from .coordinator import AldesDataUpdateCoordinator
 from .entity import AldesEntity
 
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Add Aldes binary sensors from a config_entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
-
-    binary_sensors: list[AldesBinarySensorEntity] = []
-
-    for product in coordinator.data:
-        binary_sensors.append(
-            AldesBinarySensorEntity(
-                coordinator,
-                entry,
-                product["serial_number"],
-                product["reference"],
-                product["modem"],
-            )
+    coordinator: AldesDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    async_add_entities(
+        AldesBinarySensorEntity(
+            coordinator,
+            entry,
+            product["serial_number"],
+            product["reference"],
+            product["modem"],
         )
-
-    async_add_entities(binary_sensors)
+        for product in coordinator.data
+    )
 
 
 class AldesBinarySensorEntity(AldesEntity, BinarySensorEntity):
@@ -36,38 +36,28 @@ class AldesBinarySensorEntity(AldesEntity, BinarySensorEntity):
 
     _attr_device_class = "connectivity"
 
-    @property
-    def device_info(self):
-        """Return the device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.product_serial_number)},
+    def __init__(
+        self, coordinator, config_entry, product_serial_number, reference, modem
+    ):
+        super().__init__(coordinator, config_entry, product_serial_number, modem)
+        friendly_name = FRIENDLY_NAMES.get(reference, reference)
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, product_serial_number)},
             manufacturer=MANUFACTURER,
-            name=f"{FRIENDLY_NAMES[self.reference]} {self.product_serial_number}",
-            model=FRIENDLY_NAMES[self.reference],
+            name=f"{friendly_name} {product_serial_number}",
+            model=friendly_name,
         )
-
-    @property
-    def unique_id(self):
-        """Return a unique ID to use for this entity."""
-        return f"{DOMAIN}_{self.product_serial_number}_connectivity"
-
-    @property
-    def name(self):
-        """Return a name to use for this entity."""
-        return f"{MANUFACTURER} {self.product_serial_number} connectivity"
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Update attributes when the coordinator updates."""
+        self._attr_unique_id = f"{DOMAIN}_{product_serial_number}_connectivity"
+        self._attr_name = f"{MANUFACTURER} {product_serial_number} connectivity"
         self._async_update_attrs()
-        super()._handle_coordinator_update()
+
+    def _state_snapshot(self):
+        """Return the values that make up the written state"""
+        return (*super()._state_snapshot(), self.is_on)
 
     @callback
     def _async_update_attrs(self) -> None:
         """Update binary sensor attributes."""
-        for product in self.coordinator.data:
-            if product["serial_number"] == self.product_serial_number:
-                if product["isConnected"]:
-                    self._attr_is_on = True
-                else:
-                    self._attr_is_on = False
+        product, _ = self.coordinator.index.get(self.product_serial_number, (None, {}))
+        if product is not None:
+            self._attr_is_on = bool(product["isConnected"])
@@ -1,176 +1,200 @@
 """Support for the Aldes sensors."""
 from __future__ import annotations
+from operator import itemgetter
+from typing import TYPE_CHECKING, Final
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.components.climate import (
     ClimateEntity,
     ClimateEntityFeature,
+    HVACAction,
     HVACMode,
 )
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
 from .const import DOMAIN
+from .coordinator import AldesDataUpdateCoordinator
 from .entity import AldesEntity
 
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+_TEMP_KEY_MAP: Final = {
+    "B": itemgetter("cmist", "cmast"),
+    "C": itemgetter("fmist", "fmast"),
+}
+
+# Air mode -> (HVAC mode, HVAC action); a None action is derived from the
+# temperatures through _HVAC_ACTION_TABLE.
+_AIR_MODE_TO_HVAC: Final = {
+    "A": (HVACMode.OFF, HVACAction.OFF),
+    "B": (HVACMode.HEAT, None),
+    "C": (HVACMode.HEAT, None),
+    "D": (HVACMode.AUTO, None),
+    "E": (HVACMode.AUTO, None),
+    "F": (HVACMode.COOL, None),
+    "G": (HVACMode.COOL, None),
+    "H": (HVACMode.AUTO, None),
+    "I": (HVACMode.AUTO, None),
+}
+
+_HVAC_MODE_TO_AIR_MODE: Final = {
+    HVACMode.OFF: "A",
+    HVACMode.HEAT: "B",
+    HVACMode.COOL: "F",
+}
+
+_HVAC_ACTION_TABLE: Final = {
+    (HVACMode.HEAT, -1): HVACAction.HEATING,
+    (HVACMode.HEAT, 0): HVACAction.IDLE,
+    (HVACMode.HEAT, 1): HVACAction.IDLE,
+    (HVACMode.COOL, -1): HVACAction.IDLE,
+    (HVACMode.COOL, 0): HVACAction.IDLE,
+    (HVACMode.COOL, 1): HVACAction.COOLING,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Add Aldes sensors from a config_entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
-
-    sensors: list[AldesClimateEntity] = []
-
-    for product in coordinator.data:
-        for thermostat in product["indicator"]["thermostats"]:
-            sensors.append(
-                AldesClimateEntity(
-                    coordinator,
-                    entry,
-                    product["serial_number"],
-                    product["reference"],
-                    product["modem"],
-                    thermostat["ThermostatId"],
-                )
-            )
-
-    async_add_entities(sensors)
+    coordinator: AldesDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    async_add_entities(
+        AldesClimateEntity(
+            coordinator,
+            entry,
+            product["serial_number"],
+            product["modem"],
+            thermostat["ThermostatId"],
+        )
+        for product in coordinator.data
+        for thermostat in product["indicator"]["thermostats"]
+    )
 
 
 class AldesClimateEntity(AldesEntity, ClimateEntity):
     """Define an Aldes sensor."""
 
+    _attr_hvac_modes = (HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL)
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE
+        | ClimateEntityFeature.TURN_OFF
+        | ClimateEntityFeature.TURN_ON
+    )
+    _enable_turn_on_off_backwards_compatibility = False
+    _attr_device_class = "temperature"
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_target_temperature_step = 1
+
     def __init__(
         self,
         coordinator,
         config_entry,
         product_serial_number,
-        reference,
         modem,
         thermostat_id,
     ):
-        super().__init__(
-            coordinator, config_entry, product_serial_number, reference, modem
-        )
+        super().__init__(coordinator, config_entry, product_serial_number, modem)
         self.thermostat_id = thermostat_id
-        self._attr_device_class = "temperature"
-        self._attr_temperature_unit = UnitOfTemperature.CELSIUS
-        self._attr_hvac_mode = HVACMode.OFF
-        self._attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL]
-        self._attr_supported_features = (
-            ClimateEntityFeature.TARGET_TEMPERATURE
-            | ClimateEntityFeature.TURN_OFF
-            | ClimateEntityFeature.TURN_ON
+        self._attr_unique_id = f"{DOMAIN}_{thermostat_id}_climate"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, thermostat_id)},
         )
-        self._enable_turn_on_off_backwards_compatibility = False
-        self._attr_target_temperature_step = 1
-        self._attr_hvac_action = "Unknown"
-
-    @property
-    def device_info(self):
-        """Return the device info."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.thermostat_id)},
-        )
-
-    @property
-    def unique_id(self):
-        """Return a unique ID to use for this entity."""
-        return f"{DOMAIN}_{self.thermostat_id}_climate"
-
-    @property
-    def name(self):
-        """Return a name to use for this entity."""
-        for product in self.coordinator.data:
-            if product["serial_number"] == self.product_serial_number:
-                for thermostat in product["indicator"]["thermostats"]:
-                    if thermostat["ThermostatId"] == self.thermostat_id:
-                        return f"{thermostat['Name']} climate"
-            return None
-
-    @property
-    def min_temp(self):
-        """Get the minimum temperature"""
-        for product in self.coordinator.data:
-            if product["serial_number"] == self.product_serial_number:
-                if product["indicator"]["current_air_mode"] == "B":
-                    return product["indicator"]["cmist"]
-                if product["indicator"]["current_air_mode"] == "C":
-                    return product["indicator"]["fmist"]
-            return None
-
-    @property
-    def max_temp(self):
-        """Get the maximum temperature"""
-        for product in self.coordinator.data:
-            if product["serial_number"] == self.product_serial_number:
-                if product["indicator"]["current_air_mode"] == "B":
-                    return product["indicator"]["cmast"]
-                if product["indicator"]["current_air_mode"] == "C":
-                    return product["indicator"]["fmast"]
-            return None
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Update attributes when the coordinator updates."""
+        self._attr_hvac_mode = HVACMode.OFF
+        self._attr_hvac_action = None
+        self._thermostat_name = None
+        self._attr_name = None
         self._async_update_attrs()
-        super()._handle_coordinator_update()
+
+    def _state_snapshot(self):
+        """Return the values that make up the written state"""
+        return (
+            *super()._state_snapshot(),
+            self.min_temp,
+            self.max_temp,
+            self._attr_hvac_mode,
+            self._attr_hvac_action,
+            self._attr_target_temperature,
+            self._attr_current_temperature,
+        )
 
     @callback
     def _async_update_attrs(self) -> None:
-        """Update binary sensor attributes."""
-
-        for product in self.coordinator.data:
-            if product["isConnected"]:
-                if product["serial_number"] == self.product_serial_number:
-                    if product["indicator"]["current_air_mode"] in ["A"]:
-                        self._attr_hvac_mode = HVACMode.OFF
-                    if product["indicator"]["current_air_mode"] in ["B", "C"]:
-                        self._attr_hvac_mode = HVACMode.HEAT
-                    if product["indicator"]["current_air_mode"] in ["F", "G"]:
-                        self._attr_hvac_mode = HVACMode.COOL
-                    if product["indicator"]["current_air_mode"] in ["D", "E", "H", "I"]:
-                        self._attr_hvac_mode = HVACMode.AUTO
-                    for thermostat in product["indicator"]["thermostats"]:
-                        if thermostat["ThermostatId"] == self.thermostat_id:
-                            self._attr_target_temperature = thermostat["TemperatureSet"]
-                            self._attr_current_temperature = thermostat[
-                                "CurrentTemperature"
-                            ]
-            else:
-                self._attr_current_temperature = None
+        """Update climate attributes."""
+        product, thermostats = self.coordinator.index.get(
+            self.product_serial_number, (None, {})
+        )
+        thermostat = thermostats.get(self.thermostat_id)
+        if thermostat is not None:
+            self._thermostat_name = thermostat["Name"]
+            self._attr_name = f"{self._thermostat_name} climate"
+
+        if product is None:
+            self._attr_min_temp = None
+            self._attr_max_temp = None
+            self._attr_current_temperature = None
+            self._attr_hvac_action = None
+            return
+
+        indicator = product["indicator"]
+        air_mode = indicator["current_air_mode"]
+        get_temp_bounds = _TEMP_KEY_MAP.get(air_mode)
+        if get_temp_bounds is None:
+            self._attr_min_temp = None
+            self._attr_max_temp = None
+        else:
+            self._attr_min_temp, self._attr_max_temp = get_temp_bounds(indicator)
+
+        if not product["isConnected"]:
+            self._attr_current_temperature = None
+            self._attr_hvac_action = None
+            return
+
+        self._attr_hvac_mode, hvac_action = _AIR_MODE_TO_HVAC.get(
+            air_mode, (self._attr_hvac_mode, None)
+        )
+        if thermostat is not None:
+            self._attr_target_temperature = thermostat["TemperatureSet"]
+            self._attr_current_temperature = thermostat["CurrentTemperature"]
+        if hvac_action is None:
+            hvac_action = self._determine_hvac_action()
+        self._attr_hvac_action = hvac_action
+
+    def _determine_hvac_action(self):
+        """Derive the HVAC action from the mode and the temperature delta"""
+        current = self._attr_current_temperature
+        target = self._attr_target_temperature
+        if current is None or target is None:
+            return None
+        delta = (current > target) - (current < target)
+        return _HVAC_ACTION_TABLE.get((self._attr_hvac_mode, delta))
 
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
+        # The API only takes whole degrees; keep the value that was sent.
+        target_temperature = int(kwargs[ATTR_TEMPERATURE])
         await self.coordinator.api.set_target_temperature(
             self.modem,
             self.thermostat_id,
             self._thermostat_name,
-            kwargs.get(ATTR_TEMPERATURE),
+            target_temperature,
+        )
+        _, thermostats = self.coordinator.index.get(
+            self.product_serial_number, (None, {})
         )
-        self._attr_target_temperature = kwargs.get(ATTR_TEMPERATURE)
+        if self.thermostat_id in thermostats:
+            thermostats[self.thermostat_id]["TemperatureSet"] = target_temperature
+            self.coordinator.async_set_updated_data(self.coordinator.data)
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new HVAC mode."""
-        if hvac_mode in [HVACMode.OFF, HVACMode.HEAT, HVACMode.COOL]:
-            if hvac_mode == HVACMode.OFF:
-                mode = "A"
-            elif hvac_mode == HVACMode.HEAT:
-                mode = "B"
-            elif hvac_mode == HVACMode.COOL:
-                mode = "F"
-            await self.coordinator.api.change_mode(
-                self.modem,
-                mode
-        )
-
-    @property
-    def _thermostat_name(self):
-        """Get the thermostat name as defined in the API"""
-        for product in self.coordinator.data:
-            if product["serial_number"] == self.product_serial_number:
-                for thermostat in product["indicator"]["thermostats"]:
-                    if thermostat["ThermostatId"] == self.thermostat_id:
-                        return thermostat["Name"]
-            return None
+        mode = _HVAC_MODE_TO_AIR_MODE.get(hvac_mode)
+        if mode is not None:
+            await self.coordinator.api.change_mode(self.modem, mode)
+            product, _ = self.coordinator.index.get(
+                self.product_serial_number, (None, {})
+            )
+            if product is not None:
+                product["indicator"]["current_air_mode"] = mode
+                self.coordinator.async_set_updated_data(self.coordinator.data)
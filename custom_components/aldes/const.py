@@ -1,4 +1,7 @@
 """Constants for aldes."""
+from types import MappingProxyType
+from typing import Final
+
 from homeassistant.const import Platform
 
 NAME = "Aldes"
@@ -7,8 +10,18 @@ VERSION = "0.0.1"
 
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
+CONF_SCAN_INTERVAL = "scan_interval"
+
+DEFAULT_SCAN_INTERVAL = 180
+MIN_SCAN_INTERVAL = 30
 
 MANUFACTURER = "Aldes"
-PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.SENSOR, Platform.CLIMATE]
+PLATFORMS: Final[tuple[Platform, ...]] = (
+    Platform.BINARY_SENSOR,
+    Platform.SENSOR,
+    Platform.CLIMATE,
+)
 
-FRIENDLY_NAMES = {"TONE_AIR": "T.One® AIR", "TONE_AQUA_AIR": "T.One® AquaAIR"}
+FRIENDLY_NAMES: Final = MappingProxyType(
+    {"TONE_AIR": "T.One® AIR", "TONE_AQUA_AIR": "T.One® AquaAIR"}
+)
@@ -1,39 +1,88 @@
 """Aldes"""
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 import logging
-from typing import Any
-import async_timeout
+
+import aiohttp
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import AldesApi
+from .api import AldesApi, AuthenticationException, Product, Thermostat
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class AldesDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+class AldesDataUpdateCoordinator(DataUpdateCoordinator[list[Product]]):
     """Aldes data coordinator."""
 
-    _API_TIMEOUT = 10
+    _MIN_API_TIMEOUT = 30
+    _MAX_API_TIMEOUT = 300
+    _MAX_UPDATE_INTERVAL = timedelta(minutes=10)
 
-    def __init__(self, hass: HomeAssistant, api: AldesApi):
+    def __init__(self, hass: HomeAssistant, api: AldesApi, update_interval: timedelta):
         """Initialize."""
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=1),
+            update_interval=update_interval,
+            always_update=False,
         )
         self.api = api
+        self._base_update_interval = update_interval
+        self.index: dict[str, tuple[Product, dict[int, Thermostat]]] = {}
 
-    async def _async_update_data(self) -> dict[str, Any]:
+    async def _async_update_data(self) -> list[Product]:
         """Update data via library."""
+        # Give slow polls half the interval, so longer intervals tolerate more
+        # upstream latency before the entities turn unavailable.
+        timeout = max(
+            self._MIN_API_TIMEOUT,
+            min(self._MAX_API_TIMEOUT, self.update_interval.total_seconds() / 2),
+        )
         try:
-            async with async_timeout.timeout(self._API_TIMEOUT):
-                return await self.api.fetch_data()
-        except Exception as exception:
+            async with asyncio.timeout(timeout):
+                data = await self.api.fetch_data()
+        except (
+            aiohttp.ClientError,
+            AuthenticationException,
+            TimeoutError,
+        ) as exception:
             raise UpdateFailed(exception) from exception
+        if data == self.data:
+            # Keep the previous payload: the index must point into
+            # self.data, because optimistic climate writes mutate the data
+            # through the index and then push self.data to the listeners.
+            data = self.data
+        else:
+            self.index = {
+                product["serial_number"]: (
+                    product,
+                    {
+                        thermostat["ThermostatId"]: thermostat
+                        for thermostat in product["indicator"]["thermostats"]
+                    },
+                )
+                for product in data
+            }
+        self._adjust_update_interval(data)
+        return data
+
+    def set_update_interval(self, update_interval: timedelta) -> None:
+        """Change the polling interval configured in the entry options."""
+        self._base_update_interval = update_interval
+        self.update_interval = update_interval
+
+    def _adjust_update_interval(self, data: list[Product]) -> None:
+        """Back off polling while no product is connected to the Aldes cloud."""
+        if any(product["isConnected"] for product in data):
+            self.update_interval = self._base_update_interval
+        else:
+            self.update_interval = max(
+                min(self.update_interval * 2, self._MAX_UPDATE_INTERVAL),
+                self._base_update_interval,
+            )
@@ -1,15 +1,53 @@
 """AldesEntity class"""
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .coordinator import AldesDataUpdateCoordinator
 
-class AldesEntity(CoordinatorEntity):
-    """Aldes entity"""
+
+class AldesEntity(CoordinatorEntity[AldesDataUpdateCoordinator]):
+    """Aldes entity
+
+    Every entity of a config entry reads the single coordinator stored in
+    hass.data[DOMAIN][entry_id]; entities never poll the API themselves.
+    """
 
     def __init__(
-        self, coordinator, config_entry, product_serial_number, reference, modem
+        self,
+        coordinator: AldesDataUpdateCoordinator,
+        config_entry,
+        product_serial_number,
+        modem,
     ):
         super().__init__(coordinator)
         self._attr_config_entry = config_entry
         self.product_serial_number = product_serial_number
-        self.reference = reference
         self.modem = modem
+        self._written_state = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update attributes and write the state only if it changed."""
+        # A failed poll keeps the previous data, so there is nothing to
+        # refresh; the availability change is still written below.
+        if self.coordinator.last_update_success and self.coordinator.data is not None:
+            self._async_update_attrs()
+        # Compare against the last written state: availability has already
+        # flipped when the listener runs, so a before/after comparison inside
+        # this callback would miss it.
+        state = self._state_snapshot()
+        if state != self._written_state:
+            self._written_state = state
+            super()._handle_coordinator_update()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update entity attributes from the coordinator data.
+
+        Subclasses override this; entities without coordinator-driven
+        attributes keep the default, which does nothing.
+        """
+
+    def _state_snapshot(self):
+        """Return the values that make up the written state"""
+        return (self.available, self.name)
@@ -0,0 +1,66 @@
+"""Fixtures for the Aldes tests."""
+from copy import deepcopy
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.aldes.const import CONF_PASSWORD, CONF_USERNAME, DOMAIN
+
+PRODUCT = {
+    "serial_number": "S123",
+    "reference": "TONE_AIR",
+    "modem": "M123",
+    "isConnected": True,
+    "indicator": {
+        "current_air_mode": "B",
+        "cmist": 16,
+        "cmast": 24,
+        "fmist": 20,
+        "fmast": 28,
+        "thermostats": [
+            {
+                "ThermostatId": 1,
+                "Name": "Salon",
+                "TemperatureSet": 21,
+                "CurrentTemperature": 20.5,
+            }
+        ],
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations in every test."""
+    yield
+
+
+@pytest.fixture
+def product():
+    """Return the product the API reports."""
+    return PRODUCT
+
+
+@pytest.fixture
+def mock_fetch_data(product):
+    """Return a copy of the product from every products request."""
+    with patch(
+        "custom_components.aldes.api.AldesApi.fetch_data",
+        side_effect=lambda: [deepcopy(product)],
+    ) as fetch_data:
+        yield fetch_data
+
+
+@pytest.fixture
+async def config_entry(hass, mock_fetch_data):
+    """Set up the integration and yield its config entry."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_USERNAME: "user", CONF_PASSWORD: "password"}
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    yield entry
+    # The integration has no unload hook, so stop the polling timer here.
+    await hass.data[DOMAIN][entry.entry_id].async_shutdown()
@@ -0,0 +1,71 @@
+"""Tests for the Aldes climate platform."""
+from copy import deepcopy
+from unittest.mock import patch
+
+import aiohttp
+
+from homeassistant.components.climate import (
+    ATTR_HVAC_MODE,
+    DOMAIN as CLIMATE_DOMAIN,
+    SERVICE_SET_HVAC_MODE,
+    SERVICE_SET_TEMPERATURE,
+    HVACMode,
+)
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_TEMPERATURE, STATE_UNAVAILABLE
+
+from custom_components.aldes.const import DOMAIN
+
+from .conftest import PRODUCT
+
+ENTITY_ID = "climate.salon_climate"
+
+
+async def test_availability_round_trip(hass, config_entry, mock_fetch_data):
+    """The climate state goes unavailable on a failed poll and back on recovery."""
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    assert hass.states.get(ENTITY_ID).state == HVACMode.HEAT
+
+    mock_fetch_data.side_effect = aiohttp.ClientError
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get(ENTITY_ID).state == STATE_UNAVAILABLE
+
+    product = deepcopy(PRODUCT)
+    product["indicator"]["current_air_mode"] = "F"
+    mock_fetch_data.side_effect = lambda: [deepcopy(product)]
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get(ENTITY_ID).state == HVACMode.COOL
+
+
+async def test_set_hvac_mode_writes_state(hass, config_entry):
+    """Changing the mode writes the new state without waiting for a poll."""
+    with patch(
+        "custom_components.aldes.api.AldesApi.change_mode", return_value={}
+    ) as change_mode:
+        await hass.services.async_call(
+            CLIMATE_DOMAIN,
+            SERVICE_SET_HVAC_MODE,
+            {ATTR_ENTITY_ID: ENTITY_ID, ATTR_HVAC_MODE: HVACMode.COOL},
+            blocking=True,
+        )
+
+    change_mode.assert_awaited_once_with("M123", "F")
+    assert hass.states.get(ENTITY_ID).state == HVACMode.COOL
+
+
+async def test_set_temperature_writes_sent_value(hass, config_entry):
+    """The optimistic target is the whole degree the API was sent."""
+    with patch(
+        "custom_components.aldes.api.AldesApi.set_target_temperature",
+        return_value={},
+    ) as set_target_temperature:
+        await hass.services.async_call(
+            CLIMATE_DOMAIN,
+            SERVICE_SET_TEMPERATURE,
+            {ATTR_ENTITY_ID: ENTITY_ID, ATTR_TEMPERATURE: 22.5},
+            blocking=True,
+        )
+
+    set_target_temperature.assert_awaited_once_with("M123", 1, "Salon", 22)
+    assert hass.states.get(ENTITY_ID).attributes[ATTR_TEMPERATURE] == 22
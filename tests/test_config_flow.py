@@ -0,0 +1,37 @@
+"""Tests for the Aldes config and options flows."""
+from datetime import timedelta
+
+import pytest
+import voluptuous as vol
+
+from homeassistant.data_entry_flow import FlowResultType
+
+from custom_components.aldes.const import CONF_SCAN_INTERVAL, DOMAIN
+
+
+async def test_options_flow_applies_scan_interval(hass, config_entry):
+    """A new scan interval reaches the coordinator without a reload."""
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    assert result["type"] == FlowResultType.FORM
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={CONF_SCAN_INTERVAL: 60}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert config_entry.options == {CONF_SCAN_INTERVAL: 60}
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    assert coordinator.update_interval == timedelta(seconds=60)
+
+
+async def test_options_flow_rejects_short_scan_interval(hass, config_entry):
+    """Intervals below the minimum are refused."""
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+
+    with pytest.raises(vol.Invalid):
+        await hass.config_entries.options.async_configure(
+            result["flow_id"], user_input={CONF_SCAN_INTERVAL: 5}
+        )
+
+    assert config_entry.options == {}
@@ -0,0 +1,61 @@
+"""Tests for the Aldes data update coordinator."""
+from copy import deepcopy
+from datetime import timedelta
+from unittest.mock import patch
+
+from aiohttp import web
+
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from custom_components.aldes.api import AldesApi
+from custom_components.aldes.const import CONF_SCAN_INTERVAL, DOMAIN
+from custom_components.aldes.coordinator import AldesDataUpdateCoordinator
+
+from .conftest import PRODUCT
+
+
+async def test_http_error_body_is_a_failed_poll(
+    hass, socket_enabled, aiohttp_server, caplog
+):
+    """A non-2xx response with a JSON body fails the poll like any API error."""
+
+    async def products(request):
+        return web.json_response({"message": "Internal error"}, status=500)
+
+    app = web.Application()
+    app.router.add_get("/products", products)
+    server = await aiohttp_server(app)
+    coordinator = AldesDataUpdateCoordinator(
+        hass,
+        AldesApi("user", "password", async_get_clientsession(hass)),
+        timedelta(minutes=3),
+    )
+
+    with patch.object(AldesApi, "_API_URL_PRODUCTS", str(server.make_url("/products"))):
+        await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert isinstance(coordinator.last_exception, UpdateFailed)
+    assert "Unexpected error" not in caplog.text
+
+
+async def test_backoff_restarts_from_new_interval(hass, config_entry, mock_fetch_data):
+    """Disconnected polls back off from the interval set in the options."""
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    mock_fetch_data.side_effect = lambda: [{**deepcopy(PRODUCT), "isConnected": False}]
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(minutes=6)
+
+    hass.config_entries.async_update_entry(
+        config_entry, options={CONF_SCAN_INTERVAL: 60}
+    )
+    await hass.async_block_till_done()
+    assert coordinator.update_interval == timedelta(seconds=60)
+
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=120)
+
+    mock_fetch_data.side_effect = lambda: [deepcopy(PRODUCT)]
+    await coordinator.async_refresh()
+    assert coordinator.update_interval == timedelta(seconds=60)
@@ -0,0 +1,55 @@
+"""Tests for the shared Aldes entity behaviour."""
+import aiohttp
+import pytest
+
+from homeassistant.const import STATE_UNAVAILABLE
+
+from custom_components.aldes.const import DOMAIN
+
+from .conftest import PRODUCT
+
+
+async def test_failed_refresh_marks_entities_unavailable(
+    hass, config_entry, mock_fetch_data
+):
+    """A failed poll writes the unavailable state for every entity."""
+    entity_ids = (
+        "climate.salon_climate",
+        "sensor.salon_temperature",
+        "binary_sensor.aldes_s123_connectivity",
+    )
+    for entity_id in entity_ids:
+        assert hass.states.get(entity_id).state != STATE_UNAVAILABLE
+
+    mock_fetch_data.side_effect = aiohttp.ClientError
+    await hass.data[DOMAIN][config_entry.entry_id].async_refresh()
+    await hass.async_block_till_done()
+
+    for entity_id in entity_ids:
+        assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
+
+
+async def test_recovery_with_unchanged_data_restores_state(
+    hass, config_entry, mock_fetch_data
+):
+    """A successful poll after a failure writes the previous values back."""
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    fetch_data = mock_fetch_data.side_effect
+
+    mock_fetch_data.side_effect = aiohttp.ClientError
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.salon_temperature").state == STATE_UNAVAILABLE
+
+    mock_fetch_data.side_effect = fetch_data
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.salon_temperature").state == "20.5"
+
+
+@pytest.mark.parametrize("product", [{**PRODUCT, "reference": "OTHER_MODEL"}])
+async def test_unknown_reference_keeps_entities(hass, config_entry):
+    """A product missing from FRIENDLY_NAMES still gets all of its entities."""
+    assert hass.states.get("climate.salon_climate").state == "heat"
+    assert hass.states.get("sensor.salon_temperature").state == "20.5"
+    assert hass.states.get("binary_sensor.aldes_s123_connectivity").state == "on"